@@ -5,10 +5,20 @@ import (
 	"errors"
 	"fmt"
 	"log"
+	"sync"
+	"sync/atomic"
+	"unsafe"
 
 	"github.com/gordonklaus/portaudio"
 )
 
+// hostLittleEndian reports whether int16 samples already have the linear16
+// wire layout in memory, allowing a bulk copy instead of per-sample encoding.
+var hostLittleEndian = func() bool {
+	var probe uint16 = 1
+	return *(*byte)(unsafe.Pointer(&probe)) == 1
+}()
+
 type AudioConfig struct {
 	SampleRate int `json:"sample_rate"`
 	Channels   int `json:"channels"`
@@ -18,8 +28,12 @@ type AudioConfig struct {
 type AudioStream struct {
 	stream   *portaudio.Stream
 	dataChan chan []byte
+	freeChan chan []byte
+	dropped  atomic.Int64
 	ctx      context.Context
 	cancel   context.CancelFunc
+	stopOnce sync.Once
+	stopErr  error
 }
 
 func StartAudioStream(config *AudioConfig) (result *AudioStream, resultErr error) {
@@ -29,6 +43,7 @@ func StartAudioStream(config *AudioConfig) (result *AudioStream, resultErr error
 	ctx, cancel := context.WithCancel(context.Background())
 	audio := &AudioStream{
 		dataChan: make(chan []byte, 100),
+		freeChan: make(chan []byte, 104),
 		ctx:      ctx,
 		cancel:   cancel,
 	}
@@ -44,13 +59,16 @@ func StartAudioStream(config *AudioConfig) (result *AudioStream, resultErr error
 	if inputDevice.MaxInputChannels < 1 {
 		return nil, fmt.Errorf("default audio device %q has no input channels", inputDevice.Name)
 	}
+	// The channel count is baked into the Deepgram options and the VAD gate
+	// before the device opens, so it cannot be reduced here; a device that
+	// can't satisfy the config must fail instead of silently mismatching.
 	if config.Channels > inputDevice.MaxInputChannels {
-		log.Printf(
-			"Reducing channels from %d to device maximum %d",
-			config.Channels,
+		return nil, fmt.Errorf(
+			"audio device %q supports %d input channel(s) but the config asks for %d; lower audio.channels in the config",
+			inputDevice.Name,
 			inputDevice.MaxInputChannels,
+			config.Channels,
 		)
-		config.Channels = inputDevice.MaxInputChannels
 	}
 
 	parameters := portaudio.StreamParameters{
@@ -80,35 +98,78 @@ func StartAudioStream(config *AudioConfig) (result *AudioStream, resultErr error
 	return audio, nil
 }
 
+// Stop is safe to call more than once; later calls return the first result.
 func (a *AudioStream) Stop() error {
-	a.cancel()
-	var stopErr, closeErr error
-	if a.stream != nil {
-		stopErr = a.stream.Stop()
-		closeErr = a.stream.Close()
-	}
-	close(a.dataChan)
-	terminateErr := portaudio.Terminate()
-	if err := errors.Join(stopErr, closeErr, terminateErr); err != nil {
-		return fmt.Errorf("stop audio stream: %w", err)
-	}
-	return nil
+	a.stopOnce.Do(func() {
+		a.cancel()
+		var stopErr, closeErr error
+		if a.stream != nil {
+			stopErr = a.stream.Stop()
+			closeErr = a.stream.Close()
+		}
+		close(a.dataChan)
+		if dropped := a.dropped.Load(); dropped > 0 {
+			log.Printf("Audio consumer fell behind: evicted %d stale chunks", dropped)
+		}
+		terminateErr := portaudio.Terminate()
+		if err := errors.Join(stopErr, closeErr, terminateErr); err != nil {
+			a.stopErr = fmt.Errorf("stop audio stream: %w", err)
+		}
+	})
+	return a.stopErr
 }
 
 func (a *AudioStream) audioCallback(input []int16) {
+	if len(input) == 0 {
+		return
+	}
 	select {
 	case <-a.ctx.Done():
 		return
 	default:
 	}
 
-	data := make([]byte, len(input)*2)
-	for i, sample := range input {
-		data[i*2] = byte(sample)
-		data[i*2+1] = byte(sample >> 8)
+	var data []byte
+	select {
+	case data = <-a.freeChan:
+	default:
+	}
+	if cap(data) < len(input)*2 {
+		data = make([]byte, len(input)*2)
+	}
+	data = data[:len(input)*2]
+	if hostLittleEndian {
+		copy(data, unsafe.Slice((*byte)(unsafe.Pointer(&input[0])), len(input)*2))
+	} else {
+		for i, sample := range input {
+			data[i*2] = byte(sample)
+			data[i*2+1] = byte(sample >> 8)
+		}
 	}
 	select {
 	case a.dataChan <- data:
+	default:
+		// Queue full: behave like a ring buffer by evicting the oldest
+		// chunk instead of discarding the freshest audio.
+		select {
+		case stale := <-a.dataChan:
+			a.dropped.Add(1)
+			a.recycle(stale)
+		default:
+		}
+		select {
+		case a.dataChan <- data:
+		default:
+			a.recycle(data)
+		}
+	}
+}
+
+// recycle returns a consumed chunk to the free list so the capture callback
+// can reuse it instead of allocating a fresh slice on every invocation.
+func (a *AudioStream) recycle(data []byte) {
+	select {
+	case a.freeChan <- data:
 	default:
 	}
 }
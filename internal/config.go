@@ -15,6 +15,14 @@ type TranscriptionConfig struct {
 	ProfanityFilter bool   `json:"profanity_filter"`
 	FillerWords     bool   `json:"filler_words"`
 	MipOptIn        bool   `json:"mip_opt_in"`
+	// EndpointingMS is the silence (in milliseconds) Deepgram waits before
+	// finalizing an utterance; lower values type sooner. Zero keeps the
+	// server default.
+	EndpointingMS int `json:"endpointing_ms"`
+	// Keyterms are whole phrases boosted via Deepgram keyterm prompting
+	// (nova-3 models only). Omitted, the built-in voice-command phrases are
+	// used; an empty list disables boosting.
+	Keyterms []string `json:"keyterms"`
 }
 
 type Config struct {
@@ -51,11 +59,17 @@ func LoadConfig(path string) (*Config, error) {
 	if config.Audio.SampleRate < 1 || config.Audio.Channels < 1 || config.Audio.BufferSize < 1 {
 		return nil, fmt.Errorf("audio sample_rate, channels, and buffer_size must all be positive")
 	}
+	if config.Transcription.EndpointingMS < 0 {
+		return nil, fmt.Errorf("endpointing_ms must not be negative")
+	}
 	if config.Transcription.Model == "" {
 		config.Transcription.Model = "nova-3"
 	}
 	if config.Transcription.Language == "" {
 		config.Transcription.Language = "en-US"
 	}
+	if config.Transcription.Keyterms == nil {
+		config.Transcription.Keyterms = commandPhrases()
+	}
 	return &config, nil
 }
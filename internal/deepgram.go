@@ -5,8 +5,9 @@ import (
 	"errors"
 	"fmt"
 	"log"
+	"strconv"
 	"strings"
-	"sync"
+	"time"
 
 	msginterfaces "github.com/deepgram/deepgram-go-sdk/v3/pkg/api/listen/v1/websocket/interfaces"
 	interfaces "github.com/deepgram/deepgram-go-sdk/v3/pkg/client/interfaces/v1"
@@ -16,12 +17,12 @@ import (
 var ErrVoiceStop = errors.New("recording stopped by voice command")
 
 type deepgramService struct {
-	config   *Config
-	stack    *TranscriptionStack
-	stop     chan struct{}
-	failures chan error
-	stopOnce sync.Once
-	debug    bool
+	config      *Config
+	stack       *TranscriptionStack
+	transcripts chan string
+	failures    chan error
+	closed      chan struct{}
+	debug       bool
 }
 
 type deepgramCallback struct {
@@ -45,16 +46,11 @@ func (dc *deepgramCallback) Message(response *msginterfaces.MessageResponse) err
 	if dc.service.debug {
 		log.Printf("Deepgram transcript: %s", transcript)
 	}
-	stop, err := dc.service.stack.addPhrase(transcript)
-	if err != nil {
-		select {
-		case dc.service.failures <- err:
-		default:
-		}
-		return nil
-	}
-	if stop {
-		dc.service.stopOnce.Do(func() { close(dc.service.stop) })
+	// Hand the transcript to the streaming loop: typing spawns subprocesses
+	// and must not stall the SDK's socket-reader goroutine.
+	select {
+	case dc.service.transcripts <- transcript:
+	case <-dc.service.closed:
 	}
 	return nil
 }
@@ -103,18 +99,20 @@ func StreamTranscription(
 	ctx context.Context,
 	config *Config,
 	stack *TranscriptionStack,
-	audioStream *AudioStream,
 	vadEnabled bool,
+	silenceTimeout time.Duration,
 	debug bool,
 	ready func(),
 ) error {
 	ds := &deepgramService{
-		config:   config,
-		stack:    stack,
-		stop:     make(chan struct{}),
-		failures: make(chan error, 1),
-		debug:    debug,
+		config:      config,
+		stack:       stack,
+		transcripts: make(chan string, 16),
+		failures:    make(chan error, 1),
+		closed:      make(chan struct{}),
+		debug:       debug,
 	}
+	defer close(ds.closed)
 	var gate *audioGate
 	if vadEnabled {
 		var err error
@@ -122,6 +120,7 @@ func StreamTranscription(
 		if err != nil {
 			return err
 		}
+		gate.debug = debug
 		log.Printf("Local VAD enabled (%d ms idle timeout, %d ms pre-roll)", vadIdleAfterMS, vadPreRollMS)
 	}
 	sdkInit := listen.InitLib{LogLevel: listen.LogLevelStandard}
@@ -140,10 +139,37 @@ func StreamTranscription(
 		SampleRate:      ds.config.Audio.SampleRate,
 		Channels:        ds.config.Audio.Channels,
 	}
+	if ds.config.Transcription.EndpointingMS > 0 {
+		options.Endpointing = strconv.Itoa(ds.config.Transcription.EndpointingMS)
+	}
+	// Keyterm prompting is only supported by the nova-3 family; other models
+	// reject the parameter.
+	if len(ds.config.Transcription.Keyterms) > 0 && strings.HasPrefix(ds.config.Transcription.Model, "nova-3") {
+		options.Keyterm = ds.config.Transcription.Keyterms
+	}
 	if !ds.config.Transcription.MipOptIn {
 		ctx = interfaces.WithCustomParameters(ctx, map[string][]string{"mip_opt_out": {"true"}})
 	}
 
+	// Start the capture device while the websocket performs its TLS and
+	// connection handshake; neither needs the other until the send loop.
+	var audioStream *AudioStream
+	var audioErr error
+	audioStarted := make(chan struct{})
+	go func() {
+		audioStream, audioErr = StartAudioStream(&ds.config.Audio)
+		close(audioStarted)
+	}()
+	defer func() {
+		<-audioStarted
+		if audioErr != nil {
+			return
+		}
+		if err := audioStream.Stop(); err != nil {
+			log.Printf("Failed to stop audio cleanly: %v", err)
+		}
+	}()
+
 	client, err := listen.NewWSUsingCallback(
 		ctx,
 		ds.config.DeepgramAPIKey,
@@ -154,42 +180,87 @@ func StreamTranscription(
 	if err != nil {
 		return fmt.Errorf("create Deepgram WebSocket client: %w", err)
 	}
-	if !client.Connect() {
+	// Retry the initial connect with short backoff; a transient DNS or TLS
+	// hiccup at session start otherwise surfaces as a failed hotkey press.
+	const connectAttempts = 3
+	connected := false
+	backoff := 500 * time.Millisecond
+	for attempt := 1; attempt <= connectAttempts; attempt++ {
+		if client.Connect() {
+			connected = true
+			break
+		}
 		if ctx.Err() != nil {
 			return nil
 		}
-		return fmt.Errorf("connect to Deepgram WebSocket")
+		if attempt < connectAttempts {
+			log.Printf("Deepgram connect failed (attempt %d/%d), retrying in %s", attempt, connectAttempts, backoff)
+			select {
+			case <-time.After(backoff):
+			case <-ctx.Done():
+				return nil
+			}
+			backoff *= 2
+		}
+	}
+	if !connected {
+		return fmt.Errorf("connect to Deepgram WebSocket after %d attempts", connectAttempts)
 	}
 	defer client.Stop()
+	<-audioStarted
+	if audioErr != nil {
+		return fmt.Errorf("failed to start audio: %w", audioErr)
+	}
 	if ready != nil {
 		ready()
 	}
 
 	audio := audioStream.dataChan
+	// idleSince marks when VAD last stopped hearing speech; the gate flips
+	// inactive only after vadIdleAfterMS of silence, so backdate by that much
+	// to make silenceTimeout count from the last spoken word.
+	var idleSince time.Time
 	for {
 		select {
 		case <-ctx.Done():
 			return nil
-		case <-ds.stop:
-			return ErrVoiceStop
+		case transcript := <-ds.transcripts:
+			stop, err := ds.stack.addPhrase(transcript)
+			if err != nil {
+				return err
+			}
+			if stop {
+				return ErrVoiceStop
+			}
 		case err := <-ds.failures:
 			return err
-		case data, ok := <-audio:
+		case chunk, ok := <-audio:
 			if !ok {
 				return nil
 			}
+			data := chunk
 			if gate != nil {
-				data, err = gate.Process(data)
+				data, err = gate.Process(chunk)
 				if err != nil {
 					return err
 				}
-				if len(data) == 0 {
-					continue
+				if silenceTimeout > 0 {
+					if gate.active {
+						idleSince = time.Time{}
+					} else if idleSince.IsZero() {
+						idleSince = time.Now().Add(-vadIdleAfterMS * time.Millisecond)
+					} else if time.Since(idleSince) >= silenceTimeout {
+						log.Printf("Auto-stop: no speech for %s", silenceTimeout)
+						return nil
+					}
 				}
 			}
-			if err := client.WriteBinary(data); err != nil {
-				return fmt.Errorf("send audio to Deepgram: %w", err)
+			if len(data) > 0 {
+				if err := client.WriteBinary(data); err != nil {
+					return fmt.Errorf("send audio to Deepgram: %w", err)
+				}
 			}
+			audioStream.recycle(chunk)
 		}
 	}
 }
@@ -6,6 +6,7 @@ import (
 	"log"
 	"os"
 	"os/exec"
+	"strconv"
 	"strings"
 	"time"
 
@@ -37,9 +38,15 @@ var (
 	}
 )
 
+// TextInjector is I/O-bound: cost is dominated by spawning the typing tool
+// and its display-server round-trip, not by in-process work. Optimize by
+// reducing process spawns (batching repeats, one invocation per command)
+// rather than micro-optimizing the Go side.
 type TextInjector struct {
 	displayServer  string
 	availableTools map[string]bool
+	directTools    []string
+	comboTools     []string
 }
 
 func NewTextInjector() *TextInjector {
@@ -59,22 +66,55 @@ func NewTextInjector() *TextInjector {
 			injector.availableTools[tool] = true
 		}
 	}
+	for _, tool := range directToolOrder[displayServer] {
+		if injector.availableTools[tool] {
+			injector.directTools = append(injector.directTools, tool)
+		}
+	}
+	for _, tool := range comboToolOrder[displayServer] {
+		if injector.availableTools[tool] {
+			injector.comboTools = append(injector.comboTools, tool)
+		}
+	}
 	return injector
 }
 
+// pasteTextThreshold is where clipboard paste overtakes direct typing: paste
+// costs a flat ~100 ms while typing accrues per-character delay, but paste
+// also briefly borrows the clipboard, so short phrases keep using keystrokes.
+const pasteTextThreshold = 60
+
 func (ti *TextInjector) typeText(text string) error {
 	if text == "" {
 		return nil
 	}
-	var failures []error
-	for _, tool := range directToolOrder[ti.displayServer] {
-		if !ti.availableTools[tool] {
-			continue
+	if len(text) > pasteTextThreshold {
+		pasteErr := ti.pasteText(text)
+		if pasteErr == nil {
+			return nil
+		}
+		if err := ti.typeDirect(text); err != nil {
+			return errors.Join(pasteErr, err)
 		}
+		return nil
+	}
+	directErr := ti.typeDirect(text)
+	if directErr == nil {
+		return nil
+	}
+	if err := ti.pasteText(text); err != nil {
+		return errors.Join(directErr, err)
+	}
+	return nil
+}
+
+func (ti *TextInjector) typeDirect(text string) error {
+	var failures []error
+	for _, tool := range ti.directTools {
 		var command *exec.Cmd
 		switch tool {
 		case "xdotool":
-			command = exec.Command(tool, "type", "--delay", "50", "--", text)
+			command = exec.Command(tool, "type", "--delay", "5", "--", text)
 		case "wtype":
 			command = exec.Command(tool, "--", text)
 		case "ydotool":
@@ -87,9 +127,12 @@ func (ti *TextInjector) typeText(text string) error {
 		}
 	}
 	if len(failures) == 0 {
-		failures = append(failures, fmt.Errorf("no direct typing tool is installed"))
+		return fmt.Errorf("no direct typing tool is installed")
 	}
+	return errors.Join(failures...)
+}
 
+func (ti *TextInjector) pasteText(text string) error {
 	var original string
 	var err error
 	if ti.displayServer == "wayland" && ti.availableTools["wl-paste"] {
@@ -100,10 +143,10 @@ func (ti *TextInjector) typeText(text string) error {
 		original, err = clipboard.ReadAll()
 	}
 	if err != nil {
-		return errors.Join(append(failures, fmt.Errorf("read clipboard: %w", err))...)
+		return fmt.Errorf("read clipboard: %w", err)
 	}
 	if err := ti.writeClipboard(text); err != nil {
-		return errors.Join(append(failures, fmt.Errorf("write clipboard: %w", err))...)
+		return fmt.Errorf("write clipboard: %w", err)
 	}
 
 	pasteErr := ti.typeKeyCombo([]string{"ctrl", "v"})
@@ -112,18 +155,19 @@ func (ti *TextInjector) typeText(text string) error {
 		log.Printf("Failed to restore clipboard: %v", err)
 	}
 	if pasteErr != nil {
-		return errors.Join(append(failures, fmt.Errorf("paste clipboard: %w", pasteErr))...)
+		return fmt.Errorf("paste clipboard: %w", pasteErr)
 	}
 	return nil
 }
 
 func (ti *TextInjector) typeKeyCombo(keys []string) error {
+	return ti.typeRepeatedKeyCombo(keys, 1)
+}
+
+func (ti *TextInjector) typeRepeatedKeyCombo(keys []string, count int) error {
 	var failures []error
-	for _, tool := range comboToolOrder[ti.displayServer] {
-		if !ti.availableTools[tool] {
-			continue
-		}
-		command, err := keyComboCommand(tool, keys)
+	for _, tool := range ti.comboTools {
+		command, err := repeatedKeyComboCommand(tool, keys, count)
 		if err == nil {
 			err = command.Run()
 		}
@@ -183,6 +227,69 @@ func keyComboCommand(tool string, keys []string) (*exec.Cmd, error) {
 	}
 }
 
+// repeatedKeyComboCommand builds one tool invocation that presses the combo
+// count times, so repeated keys cost a single fork/exec instead of one each.
+func repeatedKeyComboCommand(tool string, keys []string, count int) (*exec.Cmd, error) {
+	if count < 1 {
+		return nil, fmt.Errorf("invalid repeat count %d", count)
+	}
+	if count == 1 {
+		return keyComboCommand(tool, keys)
+	}
+	if len(keys) == 0 {
+		return nil, fmt.Errorf("empty key combo")
+	}
+	switch tool {
+	case "xdotool":
+		return exec.Command(tool, "key", "--repeat", strconv.Itoa(count), strings.Join(keys, "+")), nil
+	case "ydotool":
+		codes := make([]int, len(keys))
+		for i, key := range keys {
+			code, found := ydotoolKeycodes[key]
+			if !found {
+				return nil, fmt.Errorf("unsupported key %q", key)
+			}
+			codes[i] = code
+		}
+		args := []string{"key"}
+		for range count {
+			for _, code := range codes {
+				args = append(args, fmt.Sprintf("%d:1", code))
+			}
+			for i := len(codes) - 1; i >= 0; i-- {
+				args = append(args, fmt.Sprintf("%d:0", codes[i]))
+			}
+		}
+		return exec.Command(tool, args...), nil
+	case "wtype":
+		repeated := keys
+		hold := ""
+		if len(keys) == 2 && (keys[0] == "shift" || keys[0] == "ctrl") {
+			hold = keys[0]
+			repeated = keys[1:]
+		} else if len(keys) != 1 {
+			return nil, fmt.Errorf("unsupported key combo %v", keys)
+		}
+		key, found := wtypeKeys[repeated[0]]
+		if !found {
+			return nil, fmt.Errorf("unsupported key %q", repeated[0])
+		}
+		var args []string
+		if hold != "" {
+			args = append(args, "-M", hold)
+		}
+		for range count {
+			args = append(args, "-k", key)
+		}
+		if hold != "" {
+			args = append(args, "-m", hold)
+		}
+		return exec.Command(tool, args...), nil
+	default:
+		return nil, fmt.Errorf("unsupported typing tool %q", tool)
+	}
+}
+
 func (ti *TextInjector) writeClipboard(text string) error {
 	if ti.displayServer == "wayland" && ti.availableTools["wl-copy"] {
 		command := exec.Command("wl-copy")
@@ -192,18 +299,16 @@ func (ti *TextInjector) writeClipboard(text string) error {
 	return clipboard.WriteAll(text)
 }
 
-func (ti *TextInjector) typeLineBreak() error {
-	if err := ti.typeKeyCombo([]string{"shift", "Return"}); err == nil {
+func (ti *TextInjector) typeLineBreaks(count int) error {
+	if err := ti.typeRepeatedKeyCombo([]string{"shift", "Return"}, count); err == nil {
 		return nil
 	}
-	return ti.typeKeyCombo([]string{"Return"})
+	return ti.typeRepeatedKeyCombo([]string{"Return"}, count)
 }
 
 func (ti *TextInjector) typeBackspaces(count int) error {
-	for range count {
-		if err := ti.typeKeyCombo([]string{"BackSpace"}); err != nil {
-			return err
-		}
+	if count < 1 {
+		return nil
 	}
-	return nil
+	return ti.typeRepeatedKeyCombo([]string{"BackSpace"}, count)
 }
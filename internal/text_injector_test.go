@@ -34,6 +34,27 @@ func TestWtypeKeyCombosPreserveModifiers(t *testing.T) {
 	}
 }
 
+func TestRepeatedKeyComboUsesOneInvocation(t *testing.T) {
+	tests := []struct {
+		tool string
+		keys []string
+		args []string
+	}{
+		{"xdotool", []string{"shift", "Return"}, []string{"xdotool", "key", "--repeat", "3", "shift+Return"}},
+		{"ydotool", []string{"BackSpace"}, []string{"ydotool", "key", "14:1", "14:0", "14:1", "14:0", "14:1", "14:0"}},
+		{"wtype", []string{"shift", "Return"}, []string{"wtype", "-M", "shift", "-k", "Return", "-k", "Return", "-k", "Return", "-m", "shift"}},
+	}
+	for _, test := range tests {
+		command, err := repeatedKeyComboCommand(test.tool, test.keys, 3)
+		if err != nil {
+			t.Fatalf("repeatedKeyComboCommand(%s, %v): %v", test.tool, test.keys, err)
+		}
+		if !slices.Equal(command.Args, test.args) {
+			t.Fatalf("repeatedKeyComboCommand(%s, %v) = %v, want %v", test.tool, test.keys, command.Args, test.args)
+		}
+	}
+}
+
 func TestYdotoolReleasesKeysInReverseOrder(t *testing.T) {
 	command, err := keyComboCommand("ydotool", []string{"ctrl", "v"})
 	if err != nil {
@@ -2,7 +2,9 @@ package internal
 
 import (
 	"fmt"
+	"maps"
 	"regexp"
+	"slices"
 	"strconv"
 	"strings"
 	"unicode/utf8"
@@ -26,14 +28,13 @@ type voiceCommand struct {
 
 type textTyper interface {
 	typeText(string) error
-	typeLineBreak() error
+	typeLineBreaks(int) error
 	typeBackspaces(int) error
 }
 
 var (
-	commandSanitizeRegex = regexp.MustCompile(`[^a-z0-9\s]+`)
-	undoWordsRegex       = regexp.MustCompile(`^undo(?: last)? (?:(\d+|one|two|three|four|five|six|seven|eight|nine|ten) )?words?$`)
-	exactCommands        = map[string]commandKind{
+	undoWordsRegex = regexp.MustCompile(`^undo(?: last)? (?:(\d+|one|two|three|four|five|six|seven|eight|nine|ten) )?words?$`)
+	exactCommands  = map[string]commandKind{
 		"undo": commandUndoPhrase, "undo that": commandUndoPhrase, "undo this": commandUndoPhrase,
 		"delete that": commandUndoPhrase, "delete this": commandUndoPhrase,
 		"newline": commandNewline, "new line": commandNewline, "next line": commandNewline, "line break": commandNewline,
@@ -47,6 +48,18 @@ var (
 	}
 )
 
+// commandPhrases lists every exact command phrase, sorted, for use as
+// Deepgram keyterms. Boosting the whole phrases (rather than their split
+// words) keeps benign dictation unaffected and makes Deepgram more likely
+// to emit a command atomically in a single final.
+func commandPhrases() []string {
+	return slices.Sorted(maps.Keys(exactCommands))
+}
+
+func isLineBreak(phrase string) bool {
+	return phrase == "\n" || phrase == "\n\n"
+}
+
 type TranscriptionStack struct {
 	phrases      []string
 	textInjector textTyper
@@ -56,10 +69,41 @@ func NewTranscriptionStack(injector textTyper) *TranscriptionStack {
 	return &TranscriptionStack{textInjector: injector}
 }
 
+// maxCommandLength comfortably exceeds the longest recognizable command
+// ("undo last <count> words" plus stray punctuation); anything longer is
+// ordinary dictation and skips normalization entirely.
+const maxCommandLength = 64
+
+// normalizeCommand lowercases and keeps only alphanumeric runs joined by
+// single spaces — one pass instead of the former trim/lower/replace/regex/
+// re-join chain, with identical results for command matching.
+func normalizeCommand(sentence string) string {
+	var normalized strings.Builder
+	normalized.Grow(len(sentence))
+	pendingSpace := false
+	for i := 0; i < len(sentence); i++ {
+		character := sentence[i]
+		if character >= 'A' && character <= 'Z' {
+			character += 'a' - 'A'
+		}
+		if (character >= 'a' && character <= 'z') || (character >= '0' && character <= '9') {
+			if pendingSpace && normalized.Len() > 0 {
+				normalized.WriteByte(' ')
+			}
+			pendingSpace = false
+			normalized.WriteByte(character)
+			continue
+		}
+		pendingSpace = true
+	}
+	return normalized.String()
+}
+
 func parseVoiceCommand(sentence string) voiceCommand {
-	normalized := strings.ToLower(strings.TrimSpace(sentence))
-	normalized = strings.ReplaceAll(normalized, "-", " ")
-	normalized = strings.Join(strings.Fields(commandSanitizeRegex.ReplaceAllString(normalized, " ")), " ")
+	if len(sentence) > maxCommandLength {
+		return voiceCommand{}
+	}
+	normalized := normalizeCommand(sentence)
 	if kind, found := exactCommands[normalized]; found {
 		return voiceCommand{kind: kind}
 	}
@@ -95,13 +139,8 @@ func (ts *TranscriptionStack) addPhrase(phrase string) (bool, error) {
 		if command.kind == commandParagraph {
 			count = 2
 		}
-		for typed := 0; typed < count; typed++ {
-			if err := ts.textInjector.typeLineBreak(); err != nil {
-				if typed > 0 {
-					ts.phrases = append(ts.phrases, strings.Repeat("\n", typed))
-				}
-				return false, fmt.Errorf("type line break: %w", err)
-			}
+		if err := ts.textInjector.typeLineBreaks(count); err != nil {
+			return false, fmt.Errorf("type line break: %w", err)
 		}
 		ts.phrases = append(ts.phrases, strings.Repeat("\n", count))
 		return false, nil
@@ -111,7 +150,7 @@ func (ts *TranscriptionStack) addPhrase(phrase string) (bool, error) {
 	if text == "" {
 		return false, nil
 	}
-	if len(ts.phrases) > 0 && ts.phrases[len(ts.phrases)-1] != "\n" && ts.phrases[len(ts.phrases)-1] != "\n\n" {
+	if len(ts.phrases) > 0 && !isLineBreak(ts.phrases[len(ts.phrases)-1]) {
 		text = " " + text
 	}
 	if err := ts.textInjector.typeText(text); err != nil {
@@ -134,13 +173,17 @@ func (ts *TranscriptionStack) undo(wordCount int) error {
 		return nil
 	}
 
-	remaining := append([]string(nil), ts.phrases...)
+	// Walk the tail without copying the stack; phrases[keep:] are dropped and
+	// an optionally trimmed boundary phrase is applied only once the
+	// backspaces have actually been typed.
 	wordsRemoved, backspaces := 0, 0
-	for wordsRemoved < wordCount && len(remaining) > 0 {
-		last := remaining[len(remaining)-1]
-		if last == "\n" || last == "\n\n" {
+	keep := len(ts.phrases)
+	trimmed, partial := "", false
+	for wordsRemoved < wordCount && keep > 0 {
+		last := ts.phrases[keep-1]
+		if isLineBreak(last) {
 			backspaces += utf8.RuneCountInString(last)
-			remaining = remaining[:len(remaining)-1]
+			keep--
 			continue
 		}
 
@@ -149,17 +192,17 @@ func (ts *TranscriptionStack) undo(wordCount int) error {
 		if remove == len(words) {
 			wordsRemoved += remove
 			backspaces += utf8.RuneCountInString(last)
-			remaining = remaining[:len(remaining)-1]
+			keep--
 			continue
 		}
 
-		updated := strings.Join(words[:len(words)-remove], " ")
+		trimmed = strings.Join(words[:len(words)-remove], " ")
 		if strings.HasPrefix(last, " ") {
-			updated = " " + updated
+			trimmed = " " + trimmed
 		}
 		wordsRemoved += remove
-		backspaces += utf8.RuneCountInString(last) - utf8.RuneCountInString(updated)
-		remaining[len(remaining)-1] = updated
+		backspaces += utf8.RuneCountInString(last) - utf8.RuneCountInString(trimmed)
+		partial = true
 	}
 
 	if backspaces == 0 {
@@ -168,6 +211,9 @@ func (ts *TranscriptionStack) undo(wordCount int) error {
 	if err := ts.textInjector.typeBackspaces(backspaces); err != nil {
 		return fmt.Errorf("undo %d words: %w", wordCount, err)
 	}
-	ts.phrases = remaining
+	ts.phrases = ts.phrases[:keep]
+	if partial {
+		ts.phrases[keep-1] = trimmed
+	}
 	return nil
 }
@@ -20,8 +20,13 @@ func (r *recordingTyper) typeText(text string) error {
 	return nil
 }
 
-func (r *recordingTyper) typeLineBreak() error {
-	return r.typeText("\n")
+func (r *recordingTyper) typeLineBreaks(count int) error {
+	for range count {
+		if err := r.typeText("\n"); err != nil {
+			return err
+		}
+	}
+	return nil
 }
 
 func (r *recordingTyper) typeBackspaces(count int) error {
@@ -43,6 +48,10 @@ func TestVoiceCommandsRequireTheWholePhrase(t *testing.T) {
 		}
 	}
 
+	if command := parseVoiceCommand("  Undo, LAST   3 words! "); command.kind != commandUndoWords || command.words != 3 {
+		t.Fatalf("messy counted undo parsed as %+v", command)
+	}
+
 	typer := &recordingTyper{}
 	stack := NewTranscriptionStack(typer)
 	stop, err := stack.addPhrase("We need to undo this migration.")
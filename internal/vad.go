@@ -27,8 +27,11 @@ type audioGate struct {
 	preRollBytes int
 	silentFrames int
 	active       bool
+	debug        bool
 	pending      []byte
 	preRoll      []byte
+	mono         []byte
+	output       []byte
 }
 
 func newAudioGate(sampleRate, channels int) (*audioGate, error) {
@@ -60,20 +63,25 @@ func newAudioGate(sampleRate, channels int) (*audioGate, error) {
 
 func (g *audioGate) Process(data []byte) ([]byte, error) {
 	g.pending = append(g.pending, data...)
-	output := make([]byte, 0, len(data))
-	for len(g.pending) >= g.frameBytes {
-		frame := g.pending[:g.frameBytes]
-		g.pending = g.pending[g.frameBytes:]
+	output := g.output[:0]
+	offset := 0
+	for len(g.pending)-offset >= g.frameBytes {
+		frame := g.pending[offset : offset+g.frameBytes]
+		offset += g.frameBytes
 
 		mono := frame
 		if g.channels > 1 {
-			mono = make([]byte, g.frameBytes/g.channels)
+			if g.mono == nil {
+				g.mono = make([]byte, g.frameBytes/g.channels)
+			}
+			mono = g.mono
 			for source, target := 0, 0; source < len(frame); source, target = source+g.channels*2, target+2 {
 				copy(mono[target:target+2], frame[source:source+2])
 			}
 		}
 		speaking, err := g.detector.Process(g.sampleRate, mono)
 		if err != nil {
+			g.pending = append(g.pending[:0], g.pending[offset:]...)
 			return nil, fmt.Errorf("detect voice activity: %w", err)
 		}
 
@@ -86,7 +94,9 @@ func (g *audioGate) Process(data []byte) ([]byte, error) {
 				if g.silentFrames >= g.idleFrames {
 					g.active = false
 					g.preRoll = g.preRoll[:0]
-					log.Println("VAD idle: pausing audio sent to Deepgram")
+					if g.debug {
+						log.Println("VAD idle: pausing audio sent to Deepgram")
+					}
 				}
 			}
 			continue
@@ -101,8 +111,14 @@ func (g *audioGate) Process(data []byte) ([]byte, error) {
 			g.preRoll = g.preRoll[:0]
 			g.silentFrames = 0
 			g.active = true
-			log.Println("VAD active: resuming audio sent to Deepgram")
+			if g.debug {
+				log.Println("VAD active: resuming audio sent to Deepgram")
+			}
 		}
 	}
+	// Compact the leftover partial frame to the front so the pending buffer
+	// stays at a steady size instead of marching through its backing array.
+	g.pending = append(g.pending[:0], g.pending[offset:]...)
+	g.output = output
 	return output, nil
 }
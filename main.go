@@ -13,12 +13,19 @@ import (
 	"strconv"
 	"strings"
 	"syscall"
+	"time"
 
 	"voice-typing/internal"
 )
 
 const version = "0.1.1"
 
+var errAlreadyRecording = errors.New("another recording is already active")
+
+// notifySendPath is resolved once so each notification skips the PATH search
+// and a missing tool is reported instead of failing on every call.
+var notifySendPath, notifySendErr = exec.LookPath("notify-send")
+
 var sessionFile = func() string {
 	base := os.Getenv("XDG_RUNTIME_DIR")
 	if base == "" {
@@ -37,9 +44,17 @@ func main() {
 	hotkey := flag.Bool("hotkey", false, "Start recording unless already active")
 	stopkey := flag.Bool("stopkey", false, "Gracefully stop active recording")
 	vadEnabled := flag.Bool("vad", true, "Pause Deepgram audio during silence")
+	autoStop := flag.Int("auto-stop", 0, "Stop recording after this many seconds of silence (0 disables; requires --vad)")
 	debug := flag.Bool("debug", false, "Enable transcript and Deepgram SDK logging")
 	flag.Parse()
 
+	if *autoStop < 0 {
+		log.Fatalf("--auto-stop must not be negative")
+	}
+	if *autoStop > 0 && !*vadEnabled {
+		log.Fatalf("--auto-stop requires --vad")
+	}
+
 	if *showVersion {
 		fmt.Printf("Voice Typing v%s\n", version)
 		return
@@ -57,20 +72,6 @@ func main() {
 		return
 	}
 
-	if *hotkey {
-		_, active, err := activeRecordingPID()
-		if err != nil {
-			log.Printf("Failed to inspect recording session: %v", err)
-			showNotification("Voice Typing Error", "Failed to check recording status", "dialog-error")
-			return
-		}
-		if active {
-			log.Println("Voice typing is already running")
-			showNotification("Voice Typing", "Voice typing is already running.", "audio-input-microphone")
-			return
-		}
-	}
-
 	if *configPath == "" {
 		configHome, err := os.UserConfigDir()
 		if err != nil {
@@ -88,7 +89,12 @@ func main() {
 		log.Fatalf("Failed to load config: %v", err)
 	}
 
-	if err := runSingleSession(cfg, *vadEnabled, *debug); err != nil {
+	if err := runSingleSession(cfg, *vadEnabled, time.Duration(*autoStop)*time.Second, *debug); err != nil {
+		if errors.Is(err, errAlreadyRecording) && *hotkey {
+			log.Println("Voice typing is already running")
+			showNotification("Voice Typing", "Voice typing is already running.", "audio-input-microphone")
+			return
+		}
 		log.Printf("Recording failed: %v", err)
 		message := []rune(err.Error())
 		if len(message) > 50 {
@@ -161,20 +167,20 @@ func signalActiveRecording(sig syscall.Signal) (bool, error) {
 	return true, nil
 }
 
-func runSingleSession(cfg *internal.Config, vadEnabled, debug bool) error {
+func runSingleSession(cfg *internal.Config, vadEnabled bool, silenceTimeout time.Duration, debug bool) error {
 	if err := os.MkdirAll(filepath.Dir(sessionFile), 0700); err != nil {
 		return fmt.Errorf("failed to create recording session directory: %w", err)
 	}
 	if _, active, err := activeRecordingPID(); err != nil {
 		return fmt.Errorf("failed to inspect recording session: %w", err)
 	} else if active {
-		return fmt.Errorf("another recording is already active")
+		return errAlreadyRecording
 	}
 
 	lock, err := os.OpenFile(sessionFile, os.O_WRONLY|os.O_CREATE|os.O_EXCL, 0600)
 	if err != nil {
 		if errors.Is(err, os.ErrExist) {
-			return fmt.Errorf("another recording is already starting")
+			return fmt.Errorf("recording session raced another start: %w", errAlreadyRecording)
 		}
 		return fmt.Errorf("failed to create recording session: %w", err)
 	}
@@ -193,21 +199,11 @@ func runSingleSession(cfg *internal.Config, vadEnabled, debug bool) error {
 	defer stopSignals()
 
 	injector := internal.NewTextInjector()
-	return record(ctx, cfg, internal.NewTranscriptionStack(injector), vadEnabled, debug)
+	return record(ctx, cfg, internal.NewTranscriptionStack(injector), vadEnabled, silenceTimeout, debug)
 }
 
-func record(ctx context.Context, config *internal.Config, transcription *internal.TranscriptionStack, vadEnabled, debug bool) error {
-	audioStream, err := internal.StartAudioStream(&config.Audio)
-	if err != nil {
-		return fmt.Errorf("failed to start audio: %w", err)
-	}
-	defer func() {
-		if err := audioStream.Stop(); err != nil {
-			log.Printf("Failed to stop audio cleanly: %v", err)
-		}
-	}()
-
-	err = internal.StreamTranscription(ctx, config, transcription, audioStream, vadEnabled, debug, func() {
+func record(ctx context.Context, config *internal.Config, transcription *internal.TranscriptionStack, vadEnabled bool, silenceTimeout time.Duration, debug bool) error {
+	err := internal.StreamTranscription(ctx, config, transcription, vadEnabled, silenceTimeout, debug, func() {
 		showNotification(
 			"Voice Typing Ready!",
 			"Focus on a text field and start talking. Say 'stop voice' to stop.",
@@ -227,7 +223,20 @@ func record(ctx context.Context, config *internal.Config, transcription *interna
 }
 
 func showNotification(title, message, icon string) {
-	if err := exec.Command("notify-send", title, message, "--icon="+icon, "--expire-time=3000").Run(); err != nil {
+	if notifySendErr != nil {
+		log.Printf("Notification skipped: %v", notifySendErr)
+		return
+	}
+	command := exec.Command(notifySendPath, title, message, "--icon="+icon, "--expire-time=3000")
+	if err := command.Start(); err != nil {
 		log.Printf("Notification failed: %v", err)
+		return
 	}
+	// Reap in the background; the caller should not wait out the
+	// notification daemon round-trip.
+	go func() {
+		if err := command.Wait(); err != nil {
+			log.Printf("Notification failed: %v", err)
+		}
+	}()
 }